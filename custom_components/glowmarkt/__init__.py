@@ -1,7 +1,9 @@
 """Glowmarkt Integration."""
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_TOKEN
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import GlowMarkt
 from .const import DOMAIN, PLATFORMS
@@ -11,7 +13,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Glowmarkt from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
-    api = GlowMarkt(username=entry.data["username"], password=entry.data["password"])
+    @callback
+    def _store_token(token: str) -> None:
+        """Persist the token so restarts can skip authentication."""
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_TOKEN: token}
+        )
+
+    api = GlowMarkt(
+        username=entry.data["username"],
+        password=entry.data["password"],
+        session=async_get_clientsession(hass),
+        token=entry.data.get(CONF_TOKEN),
+        on_token_update=_store_token,
+    )
 
     hass.data[DOMAIN][entry.entry_id] = api
 
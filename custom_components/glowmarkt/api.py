@@ -1,11 +1,15 @@
 """API to collect data from."""
 
+import asyncio
+import base64
+import time
+from collections.abc import Callable
 from datetime import datetime
-from functools import lru_cache
 from typing import Literal
 
 import aiohttp
 import aiohttp.client_exceptions
+import orjson
 
 from .models import (
     Reading,
@@ -24,77 +28,169 @@ class GlowMarkt:
 
     BASE_URL = "https://api.glowmarkt.com/api/v0-1"
     APPLICATION_ID = "b0f1b774-a586-4f72-9edd-27ead8aa7a8d"
+    # Re-authenticate slightly before the token actually expires
+    TOKEN_EXPIRY_MARGIN = 60
 
-    def __init__(self, username: str, password: str):
-        """Set up session with reuired headers."""
-        self.session = aiohttp.ClientSession()
-        self.session.headers.update(
-            {"Content-Type": "application/json", "applicationId": self.APPLICATION_ID}
-        )
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        session: aiohttp.ClientSession | None = None,
+        token: str | None = None,
+        on_token_update: Callable[[str], None] | None = None,
+    ):
+        """Set up API with required headers.
+
+        If no session is provided, one is created and owned by this instance.
+        A previously issued token can be provided to skip authentication until
+        it expires, and on_token_update is called whenever a new one is issued.
+        """
+        self._owns_session = session is None
+        self.session = session or aiohttp.ClientSession()
+        self._headers = {
+            "Content-Type": "application/json",
+            "applicationId": self.APPLICATION_ID,
+        }
 
         self.username = username
         self.password = password
 
+        self._on_token_update = on_token_update
+        self._token = token
+        self._token_exp = _token_expiry(token) if token else None
+        self._auth_lock = asyncio.Lock()
+
+        self._ve_cache: list[VirtualEntity] | None = None
+        self._ve_lock = asyncio.Lock()
+
     async def close(self) -> None:
-        """Close Session."""
-        await self.session.close()
+        """Close Session, if owned by this instance."""
+        if self._owns_session:
+            await self.session.close()
 
     async def connect(self) -> None:
         """Connect to the API with provided credentials.
 
         Get JWT token required for further authentication.
         """
-        response = await self.session.post(
-            f"{self.BASE_URL}/auth",
-            json={
-                "username": self.username,
-                "password": self.password,
-            },
-        )
+        try:
+            response = await self.session.post(
+                f"{self.BASE_URL}/auth",
+                json={
+                    "username": self.username,
+                    "password": self.password,
+                },
+                headers=self._headers,
+                raise_for_status=True,
+            )
+        except aiohttp.ClientResponseError as err:
+            raise ValueError("Failed to authenticate") from err
 
-        if response.status != 200:
-            raise ValueError("Failed to authenticate")
+        resp_json = await self._json(response)
 
-        resp_json = await response.json()
+        self._token = resp_json["token"]
+        self._token_exp = _token_expiry(self._token)
 
-        self.session.headers["token"] = resp_json["token"]
+        if self._on_token_update:
+            self._on_token_update(self._token)
 
-    @lru_cache
-    async def get_virtual_entites(self) -> list[VirtualEntity]:
-        """Get virtual entities."""
-        response = await self.session.get(f"{self.BASE_URL}/virtualentity")
+    @property
+    def token_valid(self) -> bool:
+        """Return whether a token is held that has not yet expired."""
+        if self._token is None:
+            return False
+        if self._token_exp is None:
+            # Expiry unknown, rely on the API rejecting it
+            return True
+        return time.time() < self._token_exp - self.TOKEN_EXPIRY_MARGIN
 
-        if response.status != 200:
-            raise ValueError("Failed to retrieve virtual entities")
+    async def _ensure_token(self, rejected: str | None = None) -> None:
+        """Authenticate if no valid token is held, or it matches a rejected one.
 
-        responseJson = await response.json()
+        Concurrent callers share a single authentication.
+        """
+        async with self._auth_lock:
+            if self.token_valid and self._token != rejected:
+                return
 
-        return [
-            VirtualEntity(
-                resources=[
-                    ResourceOverview(
-                        resource_id=r["resourceId"],
-                        resource_type_id=r["resourceTypeId"],
-                        name=r["name"],
-                    )
-                    for r in ve["resources"]
-                ],
-                name=ve["name"],
-                id=ve["veId"],
+            await self.connect()
+
+    async def _request(
+        self, method: str, url: str, raise_for_status: bool = True, **kwargs
+    ) -> aiohttp.ClientResponse:
+        """Make an authenticated request, re-authenticating once on 401.
+
+        Raises aiohttp.ClientResponseError on an error status, unless
+        raise_for_status is False.
+        """
+        await self._ensure_token()
+
+        token = self._token
+        response = await self.session.request(
+            method, url, headers={**self._headers, "token": token}, **kwargs
+        )
+
+        if response.status == 401:
+            response.release()
+            await self._ensure_token(rejected=token)
+            response = await self.session.request(
+                method, url, headers={**self._headers, "token": self._token}, **kwargs
             )
-            for ve in responseJson
-        ]
+
+        if raise_for_status:
+            response.raise_for_status()
+
+        return response
+
+    @staticmethod
+    async def _json(response: aiohttp.ClientResponse):
+        """Decode a JSON response body."""
+        return orjson.loads(await response.read())
+
+    async def get_virtual_entites(self) -> list[VirtualEntity]:
+        """Get virtual entities.
+
+        The result is cached, concurrent callers share a single request.
+        """
+        async with self._ve_lock:
+            if self._ve_cache is not None:
+                return self._ve_cache
+
+            try:
+                response = await self._request("GET", f"{self.BASE_URL}/virtualentity")
+            except aiohttp.ClientResponseError as err:
+                raise ValueError("Failed to retrieve virtual entities") from err
+
+            responseJson = await self._json(response)
+
+            self._ve_cache = [
+                VirtualEntity(
+                    resources=[
+                        ResourceOverview(
+                            resource_id=r["resourceId"],
+                            resource_type_id=r["resourceTypeId"],
+                            name=r["name"],
+                        )
+                        for r in ve["resources"]
+                    ],
+                    name=ve["name"],
+                    id=ve["veId"],
+                )
+                for ve in responseJson
+            ]
+
+            return self._ve_cache
 
     async def get_resources(self, entity_id: str) -> list[Resource]:
         """Get virtual entity resources."""
-        response = await self.session.get(
-            f"{self.BASE_URL}/virtualentity/{entity_id}/resources"
-        )
-
-        if response.status != 200:
-            raise ValueError("Failed to retrieve virtual entities")
+        try:
+            response = await self._request(
+                "GET", f"{self.BASE_URL}/virtualentity/{entity_id}/resources"
+            )
+        except aiohttp.ClientResponseError as err:
+            raise ValueError("Failed to retrieve virtual entities") from err
 
-        responseJson = await response.json()
+        responseJson = await self._json(response)
 
         return [
             Resource(
@@ -121,7 +217,11 @@ class GlowMarkt:
 
     async def catchup(self, resource_id: str) -> None:
         """Tell API to pull latest DCC data."""
-        await self.session.get(f"{self.BASE_URL}/resource/{resource_id}/catchup")
+        await self._request(
+            "GET",
+            f"{self.BASE_URL}/resource/{resource_id}/catchup",
+            raise_for_status=False,
+        )
 
 
     async def get_reading(
@@ -129,37 +229,38 @@ class GlowMarkt:
         resource_id: str,
         from_time: datetime,
         to_time: datetime,
-        period: Literal["PT30M30", "PT1H", "P1D", "P1W", "P1M", "P1Y"] = "PT1H",
+        period: Literal["PT30M", "PT1H", "P1D", "P1W", "P1M", "P1Y"] = "PT1H",
     ) -> Reading:
         """Get readings for a specific resource."""
-        from_str = from_time.strftime("%Y-%m-%dT%H:%M:%S")
-        to_str = to_time.strftime("%Y-%m-%dT%H:%M:%S")
-
-        url = f"{self.BASE_URL}/resource/{resource_id}/readings?from={from_str}&to={to_str}&period={period}&function=sum"
-        response = await self.session.get(url)
-
-        if response.status != 200:
-            raise ValueError("Failed to retrieve readings")
-
-        data = (await response.json())["data"]
-
-        result: list[ReadingData] = []
-
-        for epoch, value in data:
-            timestamp = datetime.fromtimestamp(epoch)
-            result.append(ReadingData(datestamp=timestamp, value=value))
-
-        return Reading(data=result)
+        from_str = from_time.isoformat(timespec="seconds")
+        to_str = to_time.isoformat(timespec="seconds")
+
+        url = f"{self.BASE_URL}/resource/{resource_id}/readings"
+        params = {"from": from_str, "to": to_str, "period": period, "function": "sum"}
+        try:
+            response = await self._request("GET", url, params=params)
+        except aiohttp.ClientResponseError as err:
+            raise ValueError("Failed to retrieve readings") from err
+
+        data = (await self._json(response))["data"]
+        fromts = datetime.fromtimestamp
+
+        return Reading(
+            data=[
+                ReadingData(datestamp=fromts(epoch), value=value)
+                for epoch, value in data
+            ]
+        )
 
     async def get_tariff(self, resource_id: str):
         """Get tariff from specific resource."""
         url = f"{self.BASE_URL}/resource/{resource_id}/tariff"
-        response = await self.session.get(url)
-
-        if response.status != 200:
-            raise ValueError("Failed to retrieve tariff")
+        try:
+            response = await self._request("GET", url)
+        except aiohttp.ClientResponseError as err:
+            raise ValueError("Failed to retrieve tariff") from err
 
-        data = (await response.json())["data"][0]
+        data = (await self._json(response))["data"][0]
 
         return TariffData(
             current_rates=TariffRates(
@@ -167,3 +268,13 @@ class GlowMarkt:
                 standing_charge=data["currentRates"]["standingCharge"],
             )
         )
+
+
+def _token_expiry(token: str) -> float | None:
+    """Return the expiry (epoch seconds) from the JWT exp claim, if present."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return float(orjson.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
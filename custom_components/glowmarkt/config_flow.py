@@ -8,6 +8,7 @@ from homeassistant import config_entries
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import GlowMarkt
 from .const import CONFIG_ENTRY_VERSION, DOMAIN
@@ -24,13 +25,13 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
 
     Data has the keys from DATA_SCHEMA with values provided by the user.
     """
-    api = GlowMarkt(data[CONF_USERNAME], data[CONF_PASSWORD])
+    api = GlowMarkt(
+        data[CONF_USERNAME], data[CONF_PASSWORD], async_get_clientsession(hass)
+    )
     try:
         await api.connect()
     except ValueError as err:
         raise InvalidAuth from err
-    finally:
-        await api.close()
 
     return {"title": "Glowmarkt Integration"}
 
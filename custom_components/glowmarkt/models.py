@@ -8,20 +8,20 @@ ResourceType = Literal[
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class ReadingData:
     """Reading Data."""
 
     datestamp: datetime
     value: float
 
-@dataclass
+@dataclass(slots=True)
 class Reading:
     """Reading."""
 
     data: list[ReadingData]
 
-@dataclass
+@dataclass(slots=True)
 class ResourceTypeInfo:
     """Resource Type Info."""
 
@@ -29,7 +29,7 @@ class ResourceTypeInfo:
     type: Literal["GAS", "ELEC"]
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceOverview:
     """Virtual Entity Resource Overview."""
 
@@ -37,7 +37,7 @@ class ResourceOverview:
     resource_type_id: str
     name: str
 
-@dataclass
+@dataclass(slots=True)
 class Resource:
     """Virtual Entity Resource."""
 
@@ -56,20 +56,20 @@ class Resource:
     created_at: str
     data_souce_unit_info: dict[str, str]
 
-@dataclass
+@dataclass(slots=True)
 class TariffRates:
     """Tariff Rates."""
 
     rate: float
     standing_charge: float
 
-@dataclass
+@dataclass(slots=True)
 class TariffData:
     """Tariff data."""
 
     current_rates: TariffRates
 
-@dataclass
+@dataclass(slots=True)
 class VirtualEntity:
     """Virtual Entity."""
 
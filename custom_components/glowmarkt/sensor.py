@@ -1,5 +1,6 @@
 """Platform for sensor integration."""
 
+import asyncio
 import logging
 from datetime import datetime, time, timedelta
 from functools import cached_property
@@ -13,12 +14,14 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfEnergy
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_change
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
+    UpdateFailed,
 )
 
 from .api import GlowMarkt
@@ -36,16 +39,20 @@ async def async_setup_entry(
     """Set up Glowmarkt entity based on config entry."""
 
     entities: list[SensorEntity] = []
-    meters: dict[str,str] = {}
+    meters: dict[str, UsageCoordinator] = {}
 
     api: GlowMarkt = hass.data[DOMAIN][entry.entry_id]
-    await api.connect()
 
     virtual_entities = await api.get_virtual_entites()
     _LOGGER.debug("Successfully loaded virtual entities: %s", virtual_entities)
 
-    for virtual_entity in virtual_entities:
-        resources = await api.get_resources(virtual_entity.id)
+    resources_per_ve = await asyncio.gather(
+        *(api.get_resources(virtual_entity.id) for virtual_entity in virtual_entities)
+    )
+
+    for virtual_entity, resources in zip(
+        virtual_entities, resources_per_ve, strict=True
+    ):
         _LOGGER.debug("Successfully loaded resources %s", resources)
 
         for resource in resources:
@@ -53,11 +60,20 @@ async def async_setup_entry(
                 "electricity.consumption",
                 "gas.consumption",
             ):
-                usage_sensor = UsageSensor(hass, resource, virtual_entity, api)
-                entities.append(usage_sensor)
+                # Save the usage coordinator as a meter so that the cost sensor can share it
+                usage_coordinator = UsageCoordinator(hass, api, resource)
+                meters[resource.classifier] = usage_coordinator
+                entry.async_on_unload(
+                    async_track_time_change(
+                        hass,
+                        usage_coordinator.async_scheduled_refresh,
+                        minute=[1, 3, 5, 31, 33, 35],
+                        second=0,
+                    )
+                )
 
-                # Save the usage sensor as a meter so that the cost sensor can reference it
-                meters[resource.classifier] = resource.resource_id
+                usage_sensor = UsageSensor(usage_coordinator, resource, virtual_entity)
+                entities.append(usage_sensor)
 
                 # Standing and Rate sensors are handled by the coordinator
                 coordinator = TariffCoordinator(hass, api, resource)
@@ -69,21 +85,80 @@ async def async_setup_entry(
         # Cost sensors must be created after usage sensors as they reference them as a meter
         for resource in resources:
             if resource.classifier == "gas.consumption.cost":
-                cost_sensor = Cost(
-                    api, resource, virtual_entity, meters["gas.consumption"]
-                )
-                entities.append(cost_sensor)
+                meter = meters["gas.consumption"]
             elif resource.classifier == "electricity.consumption.cost":
-                cost_sensor = Cost(
-                    api, resource, virtual_entity, meters["electricity.consumption"]
-                )
-                entities.append(cost_sensor)
+                meter = meters["electricity.consumption"]
+            else:
+                continue
+
+            meter.resources.append(resource)
+            cost_sensor = Cost(meter, resource, virtual_entity)
+            entities.append(cost_sensor)
 
     async_add_entities(entities, update_before_add=True)
     return True
 
 
-class UsageSensor(SensorEntity):
+class UsageCoordinator(DataUpdateCoordinator):
+    """Data update coordinator for a meter's usage and cost sensors."""
+
+    # Fallback interval used only while refreshes are failing
+    RETRY_INTERVAL = timedelta(minutes=5)
+
+    def __init__(self, hass: HomeAssistant, api: GlowMarkt, resource: Resource) -> None:
+        """Initalise the usage coordinator.
+
+        Refreshes are driven by async_scheduled_refresh between 1-5 and 31-35
+        minutes past the hour, after new half-hourly data is available.
+        """
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"usage {resource.classifier} ({resource.resource_id})",
+            update_interval=self.RETRY_INTERVAL,
+        )
+
+        self.api = api
+        self.resource = resource
+        # Resources fetched on each refresh, the meter and its cost resource
+        self.resources = [resource]
+
+    async def _async_update_data(self) -> dict[str, float]:
+        # Keep retrying on the fallback interval until a refresh succeeds
+        self.update_interval = self.RETRY_INTERVAL
+
+        # Pull latest data once for the meter, the cost resource is derived from it
+        try:
+            await self.api.catchup(self.resource.resource_id)
+        except ClientConnectionError as exc:
+            _LOGGER.error("Connection Error: %s", exc)
+        except ValueError as err:
+            raise UpdateFailed(
+                f"Failed to request {self.resource.classifier} catchup: {err}"
+            ) from err
+
+        data: dict[str, float] = {}
+
+        for resource in self.resources:
+            try:
+                value, _ = await daily_data(self.api, resource)
+            except ValueError as err:
+                raise UpdateFailed(
+                    f"Failed to fetch {resource.classifier} data: {err}"
+                ) from err
+            data[resource.resource_id] = value
+
+        # Scheduled refreshes take over again once data has been fetched
+        self.update_interval = None
+
+        return data
+
+    async def async_scheduled_refresh(self, _now: datetime) -> None:
+        """Refresh data on the scheduled time change."""
+        await self.async_request_refresh()
+
+
+class UsageSensor(CoordinatorEntity, SensorEntity):  # pyright: ignore [reportIncompatibleVariableOverride]
     """Glowmarkt Consumption Sensor."""
 
     _attr_device_class = SensorDeviceClass.ENERGY
@@ -94,19 +169,26 @@ class UsageSensor(SensorEntity):
 
     def __init__(
         self,
-        hass: HomeAssistant,
+        coordinator: UsageCoordinator,
         resource: Resource,
         virtual_entity: VirtualEntity,
-        api: GlowMarkt,
     ) -> None:
-        """Initialise Sensor."""
+        """Pass coordinator to CoordinatorEntity."""
+        super().__init__(coordinator)
+
         self._attr_unique_id = resource.resource_id
 
-        self.api = api
-        self.hass = hass
-        self.initalised = False
         self.resource = resource
         self.virtual_entity = virtual_entity
+        self._device_name = device_name(resource, virtual_entity)
+
+    @property
+    def native_value(self) -> float | None:
+        """Return today's usage from the coordinator."""
+        if not self.coordinator.data:
+            return None
+        value = self.coordinator.data.get(self.resource.resource_id)
+        return None if value is None else round(value, 2)
 
     @cached_property
     def device_info(self) -> DeviceInfo:
@@ -115,7 +197,7 @@ class UsageSensor(SensorEntity):
             identifiers={(DOMAIN, self.resource.resource_id)},
             manufacturer="Hildebrand",
             model="Glow (DCC)",
-            name=device_name(self.resource, self.virtual_entity),
+            name=self._device_name,
         )
 
     @cached_property
@@ -127,22 +209,8 @@ class UsageSensor(SensorEntity):
             case _:
                 return None
 
-    async def async_update(self) -> None:
-        """Update all Node data from Glowmarkt."""
-
-        if not self.initalised:
-            value, _ = await daily_data(self.api, self.resource)
-            if value:
-                self._attr_native_value = round(value, 2)
-                self.initalised = True
 
-        elif await should_update():
-            value, _ = await daily_data(self.api, self.resource)
-            if value:
-                self._attr_native_value = round(value, 2)
-
-
-class Cost(SensorEntity):
+class Cost(CoordinatorEntity, SensorEntity):  # pyright: ignore [reportIncompatibleVariableOverride]
     """Sensor usage for daily cost."""
 
     _attr_device_class = SensorDeviceClass.MONETARY
@@ -153,19 +221,27 @@ class Cost(SensorEntity):
 
     def __init__(
         self,
-        api: GlowMarkt,
+        coordinator: UsageCoordinator,
         resource: Resource,
         virtual_entity: VirtualEntity,
-        meter_id: str,
     ) -> None:
-        """Initialize the sensor."""
+        """Pass the meter's coordinator to CoordinatorEntity."""
+        super().__init__(coordinator)
+
         self._attr_unique_id = resource.resource_id
 
-        self.api = api
-        self.initialised = False
-        self.meter_id = meter_id
+        self.meter_id = coordinator.resource.resource_id
         self.resource = resource
         self.virtual_entity = virtual_entity
+        self._device_name = device_name(resource, virtual_entity)
+
+    @property
+    def native_value(self) -> float | None:
+        """Return today's cost in GBP from the coordinator."""
+        if not self.coordinator.data:
+            return None
+        value = self.coordinator.data.get(self.resource.resource_id)
+        return None if value is None else round(value / 100, 2)
 
     @cached_property
     def device_info(self) -> DeviceInfo:
@@ -175,50 +251,30 @@ class Cost(SensorEntity):
             identifiers={(DOMAIN, self.meter_id)},
             manufacturer="Hildebrand",
             model="Glow (DCC)",
-            name=device_name(self.resource, self.virtual_entity),
+            name=self._device_name,
         )
 
-    async def async_update(self) -> None:
-        """Fetch new data for the sensor."""
-        if not self.initialised:
-            value, _ = await daily_data(self.api, self.resource)
-            if value:
-                self._attr_native_value = round(value / 100, 2)
-                self.initialised = True
-        elif await should_update():
-            value, _ = await daily_data(self.api, self.resource)
-            if value:
-                self._attr_native_value = round(value / 100, 2)
-
 
 class TariffCoordinator(DataUpdateCoordinator):
     """Data update coordinator for the tariff sensors."""
 
     def __init__(self, hass: HomeAssistant, api: GlowMarkt, resource: Resource) -> None:
         """Initalise the tariff coordinator."""
+        # Tariffs change at most a few times a day
         super().__init__(
-            hass, _LOGGER, name="tariff", update_interval=timedelta(minutes=5)
+            hass, _LOGGER, name="tariff", update_interval=timedelta(hours=1)
         )
 
         self.api = api
-        self.rate_initalised = False
-        self.standing_initalised = False
         self.resource = resource
 
     async def _async_update_data(self) -> dict[str, float]:
-        if not self.standing_initalised or not self.rate_initalised:
+        try:
             tariff = await tariff_data(self.api, self.resource)
+        except ValueError as err:
+            raise UpdateFailed(f"Failed to fetch tariff: {err}") from err
 
-            self.rate_initalised = True
-            self.standing_initalised = True
-
-            return {"rate": tariff.rate, "standing_charge": tariff.standing_charge}
-
-        if await should_update():
-            tariff = await tariff_data(self.api, self.resource)
-            return {"rate": tariff.rate, "standing_charge": tariff.standing_charge}
-
-        return {}
+        return {"rate": tariff.rate, "standing_charge": tariff.standing_charge}
 
 
 class Rate(CoordinatorEntity, SensorEntity):  # pyright: ignore [reportIncompatibleVariableOverride]
@@ -252,21 +308,21 @@ class Rate(CoordinatorEntity, SensorEntity):  # pyright: ignore [reportIncompati
 
         self.resource = resource
         self.virtual_entity = virtual_entity
+        self._device_name = device_name(resource, virtual_entity)
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        if self.coordinator.data:
-            value = float(self.coordinator.data["rate"] / 100)
-            self._attr_native_value = round(value, 4)
-            self.async_write_ha_state()
+    @property
+    def native_value(self) -> float | None:
+        """Return the rate in GBP from the coordinator."""
+        if not self.coordinator.data:
+            return None
+        return round(float(self.coordinator.data["rate"] / 100), 4)
 
     @cached_property
     def device_info(self) -> DeviceInfo:
         """Return device information."""
         return DeviceInfo(
             identifiers={(DOMAIN, self.resource.resource_id)},
-            name=device_name(self.resource, self.virtual_entity),
+            name=self._device_name,
             manufacturer="Hildebrand",
             model="Glow (DCC)",
         )
@@ -302,21 +358,21 @@ class Standing(CoordinatorEntity, SensorEntity):  # pyright: ignore [reportIncom
 
         self.resource = resource
         self.virtual_entity = virtual_entity
+        self._device_name = device_name(resource, virtual_entity)
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        if self.coordinator.data:
-            value = float(self.coordinator.data["standing_charge"] / 100)
-            self._attr_native_value = round(value, 4)
-            self.async_write_ha_state()
+    @property
+    def native_value(self) -> float | None:
+        """Return the standing charge in GBP from the coordinator."""
+        if not self.coordinator.data:
+            return None
+        return round(float(self.coordinator.data["standing_charge"] / 100), 4)
 
     @cached_property
     def device_info(self) -> DeviceInfo:
         """Return device information."""
         return DeviceInfo(
             identifiers={(DOMAIN, self.resource.resource_id)},
-            name=device_name(self.resource, self.virtual_entity),
+            name=self._device_name,
             manufacturer="Hildebrand",
             model="Glow (DCC)",
         )
@@ -324,21 +380,14 @@ class Standing(CoordinatorEntity, SensorEntity):  # pyright: ignore [reportIncom
 
 async def daily_data(api: GlowMarkt, resource: Resource) -> tuple[float, datetime]:
     """Get daily data from Glowmarkt API."""
-    if datetime.now().time() <= time(1, 5):
+    now = datetime.now()
+    if now.time() <= time(1, 5):
         _LOGGER.debug("Fetching yesterday's data")
-        now = datetime.now() - timedelta(days=1)
-    else:
-        now = datetime.now()
+        now -= timedelta(days=1)
 
     t_from = now.replace(hour=0, minute=0, second=0, microsecond=0)
     t_to = now.replace(second=0, microsecond=0)
 
-    # Pull latest data
-    try:
-        await api.catchup(resource.resource_id)
-    except ClientConnectionError as exc:
-        _LOGGER.error("Connection Error: %s", exc)
-
     reading = await api.get_reading(resource.resource_id, t_from, t_to, "P1D")
 
     v = reading.data[0].value
@@ -365,14 +414,6 @@ def device_name(resource: Resource, virtual_entity: VirtualEntity) -> str:
     return f"{virtual_entity.name} smart {supply} meter"
 
 
-async def should_update() -> bool:
-    """Check if time is between 1-5 or 31-35 minutes past the hour."""
-    minutes = datetime.now().minute
-    if (1 <= minutes <= 5) or (31 <= minutes <= 35):
-        return True
-    return False
-
-
 def supply_type(resource: Resource) -> Literal["electricity", "gas"]:
     """Return the type of supply."""
     if "electricity.consumption" in resource.classifier: